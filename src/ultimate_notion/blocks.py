@@ -735,7 +735,10 @@ class Table(Block[obj_blocks.Table], ChildrenMixin, wraps=obj_blocks.Table):
 
     def __getitem__(self, index: tuple[int, int]) -> RichText:
         row_idx, col_idx = index
-        return self.rows[row_idx].cells[col_idx]
+        # index the low-level cells of the row directly to avoid wrapping all cells of the row for a single cell
+        row = cast(TableRow, self.children[row_idx])
+        cells = row.obj_ref.table_row.cells or []
+        return RichText.wrap_obj_ref(cells[col_idx])
 
     @property
     def width(self) -> int:
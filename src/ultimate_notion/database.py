@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from textwrap import dedent
 from typing import cast
 
@@ -30,12 +31,14 @@ class Database(DataObject[obj_blocks.Database], wraps=obj_blocks.Database):
     """
 
     _schema: type[PageSchema] | None = None
+    _title: RichText | None = None
+    _description: RichText | None = None
 
     def __str__(self):
-        if self.title:
-            return str(self.title)
-        else:
-            return 'Untitled'
+        title = self.obj_ref.title or []
+        if len(title) == 1:  # fast path for the typical case of a title with a single segment
+            return title[0].plain_text or 'Untitled'
+        return ''.join(rt_obj.plain_text or '' for rt_obj in title) or 'Untitled'
 
     def _repr_html_(self) -> str:  # noqa: PLW3201
         """Called by Jupyter Lab automatically"""
@@ -52,9 +55,10 @@ class Database(DataObject[obj_blocks.Database], wraps=obj_blocks.Database):
     @property
     def title(self) -> str | RichText:
         """Return the title of this database as rich text."""
-        title = self.obj_ref.title
+        if self._title is None:  # generate cache
+            self._title = RichText.wrap_obj_ref(self.obj_ref.title)
         # `str` added as return value but always RichText returned, which inherits from str.
-        return RichText.wrap_obj_ref(title)
+        return self._title
 
     @title.setter
     def title(self, text: str | RichText):
@@ -63,12 +67,14 @@ class Database(DataObject[obj_blocks.Database], wraps=obj_blocks.Database):
             text = RichText.from_plain_text(text)
         session = get_active_session()
         session.api.databases.update(self.obj_ref, title=text.obj_ref)
+        self._title = None  # this forces a new generation of the title next time
 
     @property
     def description(self) -> RichText:
         """Return the description of this database as rich text."""
-        desc = self.obj_ref.description
-        return RichText.wrap_obj_ref(desc)
+        if self._description is None:  # generate cache
+            self._description = RichText.wrap_obj_ref(self.obj_ref.description)
+        return self._description
 
     @description.setter
     def description(self, text: str | RichText):
@@ -77,6 +83,7 @@ class Database(DataObject[obj_blocks.Database], wraps=obj_blocks.Database):
             text = RichText.from_plain_text(text)
         session = get_active_session()
         session.api.databases.update(self.obj_ref, description=text.obj_ref)
+        self._description = None  # this forces a new generation of the description next time
 
     @property
     def icon(self) -> FileInfo | Emoji | None:
@@ -110,7 +117,10 @@ class Database(DataObject[obj_blocks.Database], wraps=obj_blocks.Database):
         return True
 
     def _reflect_schema(self, obj_ref: obj_blocks.Database) -> type[PageSchema]:
-        """Reflection about the database schema."""
+        """Reflection about the database schema.
+
+        Each wrapper gets a fresh schema class as a schema class is bound to exactly one database.
+        """
         title = str(self)
         cls_name = f'{camel_case(title)}Schema'
         attrs = {
@@ -174,28 +184,31 @@ class Database(DataObject[obj_blocks.Database], wraps=obj_blocks.Database):
         """Reload this database."""
         session = get_active_session()
         self.obj_ref = session.api.databases.retrieve(self.obj_ref.id)
+        self._title = self._description = None  # this forces a new generation next time
         self.schema._set_obj_refs()
         return self
 
     @staticmethod
-    def _pages_from_query(query: DBQueryBuilder) -> list[Page]:
+    def _pages_from_query(query: DBQueryBuilder) -> Iterator[Page]:
+        """Lazily wrap the page objects of a query, fetching more results from the server only when needed."""
         # ToDo: Remove when self.query is implemented!
         cache = get_active_session().cache
-        pages = []
         for page_obj in query.execute():
             if page_obj.id in cache:
                 page = cast(Page, cache[page_obj.id])
                 page.obj_ref = page_obj  # updates the page content
             else:
                 page = Page.wrap_obj_ref(page_obj)
-            pages.append(page)
-        return pages
+            yield page
 
-    def fetch_all(self) -> View:
-        """Fetch all pages and return a view."""
+    def fetch_all(self, limit: int | None = None) -> View:
+        """Fetch all pages, or only the first `limit` ones, and return a view."""
         session = get_active_session()
-        query = session.api.databases.query(self.obj_ref)  # ToDo: use self.query when implemented
-        return View(database=self, pages=self._pages_from_query(query), query=query)
+        # ToDo: use self.query when implemented
+        query = session.api.databases.query(self.obj_ref, prefetch=True)
+        if limit is not None:
+            query.limit(limit)
+        return View(database=self, pages=list(self._pages_from_query(query)), query=query)
 
     def __len__(self) -> int:
         """Return the number of pages in this database."""
@@ -204,7 +217,8 @@ class Database(DataObject[obj_blocks.Database], wraps=obj_blocks.Database):
     @property
     def is_empty(self) -> bool:
         """Return whether the database is empty."""
-        return len(self) == 0
+        session = get_active_session()
+        return session.api.databases.query(self.obj_ref).limit(1).first() is None
 
     def __bool__(self) -> bool:
         """Overwrite default behaviour."""
@@ -220,9 +234,8 @@ class Database(DataObject[obj_blocks.Database], wraps=obj_blocks.Database):
         """Create a page with properties according to the schema within the corresponding database."""
 
         # ToDo: let pydantic_model check the kwargs and raise an error if something is wrong
-        schema_kwargs = {prop.attr_name: prop for prop in self.schema.get_props()}
-        if not set(kwargs).issubset(set(schema_kwargs)):
-            add_kwargs = set(kwargs) - set(schema_kwargs)
+        schema_kwargs = self.schema._get_attr_prop_map()
+        if add_kwargs := kwargs.keys() - schema_kwargs.keys():
             msg = f"kwargs {', '.join(add_kwargs)} not defined in schema"
             raise SchemaError(msg)
 
@@ -240,8 +253,7 @@ class Database(DataObject[obj_blocks.Database], wraps=obj_blocks.Database):
             schema_dct[schema_kwargs[kwarg].name] = prop_value.obj_ref
 
         session = get_active_session()
-        page = Page.wrap_obj_ref(session.api.pages.create(parent=self.obj_ref, properties=schema_dct))
-        return page
+        return Page.wrap_obj_ref(session.api.pages.create(parent=self.obj_ref, properties=schema_dct))
 
     def query(self):
         """Query a (large) database for pages in a more specific way."""
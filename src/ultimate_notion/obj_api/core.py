@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, ClassVar
 from uuid import UUID
 
@@ -48,8 +50,12 @@ BLOCK_URL_LONG_RE = re.compile(
 )
 
 
+@lru_cache(maxsize=1024)
 def extract_id(text: str) -> str | None:
-    """Examine the given text to find a valid Notion object ID."""
+    """Examine the given text to find a valid Notion object ID.
+
+    The result is cached as the same IDs and URLs are typically resolved many times.
+    """
 
     m = UUID_RE.match(text)
     if m is not None:
@@ -181,6 +187,7 @@ class TypedObject(GenericObject):
     type: str
     """`type` is a string that identifies the specific object type, e.g. `heading_1`, `paragraph`, `equation`, ..."""
     _polymorphic_base: ClassVar[bool] = False
+    _type_name: ClassVar[str]  # registered 'type' name, i.e. the default of the `type` field
 
     def __init_subclass__(cls, *, type: str | None = None, polymorphic_base: bool = False, **kwargs):  # noqa: A002
         cls._polymorphic_base = polymorphic_base
@@ -202,6 +209,7 @@ class TypedObject(GenericObject):
         """Register a specific class for the given 'type' name."""
 
         cls._set_field_default('type', default=name)
+        cls._type_name = name
 
         # initialize a _typemap map for each direct child of TypedObject
 
@@ -220,6 +228,12 @@ class TypedObject(GenericObject):
 
         cls._typemap[name] = cls
 
+        # bind `value` directly to the nested field unless a subclass provides its own implementation
+        # this avoids looking up `self.type` and a dynamic `getattr` on every access
+        value_prop = next(base.__dict__['value'] for base in cls.__mro__ if 'value' in base.__dict__)
+        if name in cls.model_fields and (value_prop is TypedObject.value or isinstance(value_prop.fget, attrgetter)):
+            cls.value = property(attrgetter(name), doc=TypedObject.value.__doc__)
+
     @model_validator(mode='wrap')
     @classmethod
     def _resolve_type(cls, value: Any, handler: ValidatorFunctionWrapHandler):
@@ -8,11 +8,12 @@ is just referred to as `raw_api`.
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Literal, TypeAlias, cast
 from uuid import UUID
 
-from pydantic import SerializeAsAny, TypeAdapter
+from pydantic import SerializeAsAny
 
 from ultimate_notion.obj_api.blocks import Block, Database, Page
 from ultimate_notion.obj_api.iterator import EndpointIterator, PropertyItemList
@@ -21,11 +22,11 @@ from ultimate_notion.obj_api.objects import (
     EmojiObject,
     FileObject,
     GenericObject,
-    ObjectReference,
     PageRef,
     ParentRef,
     RichTextBaseObject,
     User,
+    get_uuid,
 )
 from ultimate_notion.obj_api.props import PropertyItem, Title
 from ultimate_notion.obj_api.query import DBQueryBuilder, SearchQueryBuilder
@@ -50,9 +51,22 @@ class SessionError(Exception):
         super().__init__(message)
 
 
+def _serialize_props(props: Mapping[str, GenericObject | dict[str, Any] | None]) -> dict[str, Any]:
+    """Serialize properties, i.e. property values or types, for a request keeping `None` to delete properties.
+
+    Already serialized properties, i.e. dictionaries, are passed as they are.
+    """
+    return {
+        name: prop if prop is None or isinstance(prop, dict) else prop.serialize_for_api()
+        for name, prop in props.items()
+    }
+
+
 class NotionAPI:
     """Object-based Notion API (pydantic) with all endpoints."""
 
+    __slots__ = ('blocks', 'client', 'databases', 'pages', 'search', 'users')
+
     def __init__(self, client: NCClient):
         self.client = client
 
@@ -66,6 +80,8 @@ class NotionAPI:
 class Endpoint:
     """Baseclass of the Notion API endpoints."""
 
+    __slots__ = ('api',)
+
     def __init__(self, api: NotionAPI):
         self.api = api
 
@@ -73,9 +89,13 @@ class Endpoint:
 class BlocksEndpoint(Endpoint):
     """Interface to the 'blocks' endpoint of the Notion API"""
 
+    __slots__ = ('children',)
+
     class ChildrenEndpoint(Endpoint):
         """Interface to the API 'blocks/children' endpoint."""
 
+        __slots__ = ()
+
         @property
         def raw_api(self) -> NCBlocksChildrenEndpoint:
             """Return the underlying endpoint in the Notion SDK."""
@@ -90,10 +110,12 @@ class BlocksEndpoint(Endpoint):
             The blocks info of the passed blocks will be updated and returned as first part of a tuple.
             The second party of the tuple is an empty list or the updated blocks after the specified block
             if `after` was specified. Use this to update the blocks with the latest version from the server.
+            Entries of `blocks` that are `None` are skipped.
             """
 
-            parent_id = ObjectReference.build(parent).id
-            children = [block.serialize_for_api() for block in blocks if block is not None]
+            parent_id = get_uuid(parent)
+            blocks = [block for block in blocks if block is not None]
+            children = [block.serialize_for_api() for block in blocks]
 
             logger.info('Appending %d blocks to %s ...', len(children), parent_id)
 
@@ -108,7 +130,7 @@ class BlocksEndpoint(Endpoint):
 
             # the first len(blocks) of appended_blocks correspond to the blocks we passed, the rest are updated
             # blocks after the specified block, where we append the blocks.
-            for block, appended_block in zip(blocks, appended_blocks[: len(blocks)], strict=True):
+            for block, appended_block in zip(blocks, islice(appended_blocks, len(blocks)), strict=True):
                 block.update(**appended_block.model_dump())
 
             return blocks, cast(list[Block], appended_blocks[len(blocks) :])
@@ -120,9 +142,9 @@ class BlocksEndpoint(Endpoint):
             `parent` may be any suitable `ObjectReference` type.
             """
 
-            parent_id = ObjectReference.build(parent).id
+            parent_id = get_uuid(parent)
 
-            logger.info('Listing blocks for %s...', parent_id)
+            logger.debug('Listing blocks for %s...', parent_id)
 
             blocks = EndpointIterator(endpoint=self.raw_api.list)
 
@@ -146,7 +168,7 @@ class BlocksEndpoint(Endpoint):
         `block` may be any suitable `ObjectReference` type.
         """
 
-        block_id = str(ObjectReference.build(block).id)
+        block_id = str(get_uuid(block))
         logger.info('Deleting block :: %s', block_id)
 
         data = self.raw_api.delete(block_id)
@@ -159,7 +181,7 @@ class BlocksEndpoint(Endpoint):
         `block` may be any suitable `ObjectReference` type.
         """
 
-        block_id = str(ObjectReference.build(block).id)
+        block_id = str(get_uuid(block))
         logger.info('Restoring block :: %s', block_id)
 
         data = self.raw_api.update(block_id, archived=False)
@@ -173,8 +195,8 @@ class BlocksEndpoint(Endpoint):
         `block` may be any suitable `ObjectReference` type.
         """
 
-        block_id = str(ObjectReference.build(block).id)
-        logger.info('Retrieving block :: %s', block_id)
+        block_id = str(get_uuid(block))
+        logger.debug('Retrieving block :: %s', block_id)
 
         data = self.raw_api.retrieve(block_id)
 
@@ -187,10 +209,14 @@ class BlocksEndpoint(Endpoint):
         The block info will be updated to the latest version from the server.
         """
 
-        logger.info('Updating block :: %s', block.id)
+        logger.debug('Updating block :: %s', block.id)
+
+        # Only the type-specific data and the trash state of a block can be updated, so we don't send the rest.
+        block_data = block.serialize_for_api()
+        request = {key: block_data[key] for key in (block.type, 'archived', 'in_trash') if key in block_data}
 
         # Typing in notion_client sucks, so we cast
-        data = cast(dict[str, Any], self.raw_api.update(block.id.hex, **block.serialize_for_api()))
+        data = cast(dict[str, Any], self.raw_api.update(block.id.hex, **request))
 
         return block.update(**data)
 
@@ -198,6 +224,8 @@ class BlocksEndpoint(Endpoint):
 class DatabasesEndpoint(Endpoint):
     """Interface to the 'databases' endpoint of the Notion API."""
 
+    __slots__ = ()
+
     @property
     def raw_api(self) -> NCDatabasesEndpoint:
         """Return the underlying endpoint in the Notion SDK."""
@@ -205,8 +233,8 @@ class DatabasesEndpoint(Endpoint):
 
     @staticmethod
     def _build_request(
-        parent: SerializeAsAny[ParentRef] | None = None,
-        schema: dict[str, PropertyType] | None = None,
+        parent: SerializeAsAny[ParentRef] | dict[str, Any] | None = None,
+        schema: Mapping[str, PropertyType | dict[str, Any] | None] | None = None,
         title: list[RichTextBaseObject] | None = None,
         description: list[RichTextBaseObject] | None = None,
     ) -> dict[str, Any]:
@@ -214,11 +242,12 @@ class DatabasesEndpoint(Endpoint):
 
         *NOTE* this method does not anticipate what the request will be used for and as
         such does not validate the inputs for any particular requests.
+        The parent and the property types of the schema can also be passed in an already serialized form.
         """
         request: dict[str, Any] = {}
 
         if parent is not None:
-            request['parent'] = parent.serialize_for_api()
+            request['parent'] = parent if isinstance(parent, dict) else parent.serialize_for_api()
 
         if title is not None:
             request['title'] = [rt_obj.serialize_for_api() for rt_obj in title]
@@ -227,9 +256,7 @@ class DatabasesEndpoint(Endpoint):
             request['description'] = [rt_obj.serialize_for_api() for rt_obj in description]
 
         if schema is not None:
-            request['properties'] = {
-                name: value.serialize_for_api() if value is not None else None for name, value in schema.items()
-            }
+            request['properties'] = _serialize_props(schema)
 
         return request
 
@@ -257,8 +284,8 @@ class DatabasesEndpoint(Endpoint):
         `dbref` may be any suitable `DatabaseRef` type.
         """
 
-        db_id = DatabaseRef.build(dbref).database_id
-        logger.info(f'Retrieving database with id `{db_id}`')
+        db_id = get_uuid(dbref)
+        logger.debug('Retrieving database with id `%s`', db_id)
         data = self.raw_api.retrieve(str(db_id))
 
         return Database.model_validate(data)
@@ -276,7 +303,7 @@ class DatabasesEndpoint(Endpoint):
 
         API reference: https://developers.notion.com/reference/update-a-database
         """
-        logger.info(f'Updating database info of `{db.title}`')
+        logger.debug('Updating database info of `%s`', db.title)
 
         if request := self._build_request(schema=schema, title=title, description=description):
             # https://github.com/ramnes/notion-sdk-py/blob/main/notion_client/api_endpoints.py
@@ -289,7 +316,7 @@ class DatabasesEndpoint(Endpoint):
     def delete(self, db: Database) -> Database:
         """Delete (archive) the specified Database."""
 
-        db_id = DatabaseRef.build(db).database_id
+        db_id = get_uuid(db)
 
         logger.info(f'Deleting database `{db}` with id {db_id}')
 
@@ -302,7 +329,7 @@ class DatabasesEndpoint(Endpoint):
     def restore(self, db: Database) -> Database:
         """Restore (unarchive) the specified Database."""
 
-        db_id = DatabaseRef.build(db).database_id
+        db_id = get_uuid(db)
 
         logger.info(f'Restoring database `{db}` with id {db_id}')
 
@@ -313,20 +340,32 @@ class DatabasesEndpoint(Endpoint):
         return db
 
     # https://developers.notion.com/reference/post-database-query
-    def query(self, db: Database | UUID | str) -> DBQueryBuilder:
-        """Initialize a new Query object with the target data class."""
-        db_id = DatabaseRef.build(db).database_id
-        logger.info('Initializing database query :: {%s}', db_id)
+    def query(
+        self, db: Database | UUID | str, *, filter_properties: list[str] | None = None, prefetch: bool = False
+    ) -> DBQueryBuilder:
+        """Initialize a new Query object with the target data class.
+
+        Only the properties with the IDs given in `filter_properties` are retrieved, default is all properties.
+        With `prefetch`, the next page of results is already requested while the current one is processed.
+        """
+        db_id = get_uuid(db)
+        logger.debug('Initializing database query :: %s', db_id)
 
-        return DBQueryBuilder(endpoint=self.raw_api.query, db_id=str(db_id))
+        return DBQueryBuilder(
+            endpoint=self.raw_api.query, db_id=str(db_id), filter_properties=filter_properties, prefetch=prefetch
+        )
 
 
 class PagesEndpoint(Endpoint):
     """Interface to the API 'pages' endpoint."""
 
+    __slots__ = ('properties',)
+
     class PropertiesEndpoint(Endpoint):
         """Interface to the API 'pages/properties' endpoint."""
 
+        __slots__ = ()
+
         @property
         def raw_api(self):
             """Return the underlying endpoint in the Notion SDK"""
@@ -336,12 +375,15 @@ class PagesEndpoint(Endpoint):
         def retrieve(self, page_id, property_id):
             """Return the Property on a specific Page with the given ID"""
 
-            logger.info('Retrieving property :: %s [%s]', property_id, page_id)
+            logger.debug('Retrieving property :: %s [%s]', property_id, page_id)
 
             data = self.raw_api.retrieve(page_id, property_id)
 
             # TODO should PropertyListItem return an iterator instead?
-            return TypeAdapter(PropertyItem | PropertyItemList).validate_python(data)
+            # the object type tells us which model to use, so pydantic doesn't have to try both
+            if data['object'] == 'list':
+                return PropertyItemList.model_validate(data)
+            return PropertyItem.model_validate(data)
 
     def __init__(self, *args, **kwargs):
         """Initialize the `pages` endpoint for the Notion API"""
@@ -382,9 +424,7 @@ class PagesEndpoint(Endpoint):
         if title is not None:
             properties['title'] = title
 
-        request['properties'] = {
-            name: prop.serialize_for_api() if prop is not None else None for name, prop in properties.items()
-        }
+        request['properties'] = _serialize_props(properties)
 
         if children is not None:
             request['children'] = [child.serialize_for_api() for child in children if child is not None]
@@ -418,9 +458,9 @@ class PagesEndpoint(Endpoint):
         `page` may be any suitable `PageRef` type.
         """
 
-        page_id = PageRef.build(page).page_id
+        page_id = get_uuid(page)
 
-        logger.info('Retrieving page :: %s', page_id)
+        logger.debug('Retrieving page :: %s', page_id)
 
         data = self.raw_api.retrieve(page_id)
 
@@ -441,13 +481,12 @@ class PagesEndpoint(Endpoint):
         The page info will be updated to the latest version from the server.
         """
 
-        logger.info('Updating page info :: %s', page.id)
+        logger.debug('Updating page info :: %s', page.id)
 
         if not properties:
             properties = page.properties
 
-        props = {name: value.serialize_for_api() if value is not None else None for name, value in properties.items()}
-        data = self.raw_api.update(page.id.hex, properties=props)
+        data = self.raw_api.update(page.id.hex, properties=_serialize_props(properties))
 
         return page.update(**data)
 
@@ -466,7 +505,7 @@ class PagesEndpoint(Endpoint):
         To remove an attribute, set its value to None.
         """
 
-        page_id = PageRef.build(page).page_id
+        page_id = get_uuid(page)
 
         props: dict[str, Any] = {}
 
@@ -502,6 +541,8 @@ class PagesEndpoint(Endpoint):
 class SearchEndpoint(Endpoint):
     """Interface to the API 'search' endpoint."""
 
+    __slots__ = ()
+
     # https://developers.notion.com/reference/post-search
     def __call__(self, text=None) -> SearchQueryBuilder:
         """Perform a search with the optional text"""
@@ -511,6 +552,8 @@ class SearchEndpoint(Endpoint):
 class UsersEndpoint(Endpoint):
     """Interface to the API 'users' endpoint."""
 
+    __slots__ = ()
+
     @property
     def raw_api(self):
         """Return the underlying endpoint in the Notion SDK"""
@@ -520,7 +563,7 @@ class UsersEndpoint(Endpoint):
     def list(self) -> Iterator[User]:
         """Return an iterator for all users in the workspace."""
 
-        logger.info('Listing known users...')
+        logger.debug('Listing known users...')
 
         users = EndpointIterator(endpoint=self.raw_api.list)
 
@@ -530,7 +573,7 @@ class UsersEndpoint(Endpoint):
     def retrieve(self, user_id) -> User:
         """Return the User with the given ID."""
 
-        logger.info('Retrieving user :: %s', user_id)
+        logger.debug('Retrieving user :: %s', user_id)
 
         data = self.raw_api.retrieve(user_id)
 
@@ -540,7 +583,7 @@ class UsersEndpoint(Endpoint):
     def me(self) -> User:
         """Return the current bot User."""
 
-        logger.info('Retrieving current integration bot')
+        logger.debug('Retrieving current integration bot')
 
         data = self.raw_api.me()
 
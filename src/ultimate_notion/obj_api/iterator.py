@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import logging
+import time
 from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated, Any
 
+from notion_client.errors import APIErrorCode, APIResponseError
 from pydantic import Field
 from pydantic.functional_validators import BeforeValidator
 
@@ -15,6 +18,7 @@ from ultimate_notion.obj_api.objects import User
 from ultimate_notion.obj_api.props import PropertyItem
 
 MAX_PAGE_SIZE = 100
+MAX_RATE_LIMIT_RETRIES = 5
 
 logger = logging.getLogger(__name__)
 
@@ -104,16 +108,25 @@ class PropertyItemList(ObjectList, type='property_item'):
 
 
 class EndpointIterator:
-    """Functor to iterate over results from a paginated API response."""
+    """Functor to iterate over results from a paginated API response.
+
+    With `prefetch`, the next page of results is requested in a background thread while the
+    results of the current page are processed. Requests are retried if Notion's rate limit is hit.
+    With `max_results`, the iteration stops after the given number of results.
+    """
 
     has_more: bool | None = None
     page_num: int = -1
     total_items: int = -1
     next_cursor: str | None = None
 
-    def __init__(self, endpoint: Callable[..., Any | Awaitable[Any]]):
+    def __init__(
+        self, endpoint: Callable[..., Any | Awaitable[Any]], *, prefetch: bool = False, max_results: int | None = None
+    ):
         """Initialize an object list iterator for the specified endpoint."""
         self._endpoint = endpoint
+        self._prefetch = prefetch
+        self._max_results = max_results
 
     def __call__(self, **kwargs: Any) -> Iterator[NotionObject]:
         """Return a generator for this endpoint using the given parameters."""
@@ -127,16 +140,68 @@ class EndpointIterator:
 
         self.next_cursor = kwargs.pop('start_cursor', None)
 
-        while self.has_more:
-            self.page_num += 1
-
-            result_page = self._endpoint(start_cursor=self.next_cursor, **kwargs)
-
-            api_list = ObjectList.model_validate(result_page)
-
-            for obj in api_list.results:
-                self.total_items += 1
-                yield obj
-
-            self.next_cursor = api_list.next_cursor
-            self.has_more = api_list.has_more and self.next_cursor is not None
+        executor = ThreadPoolExecutor(max_workers=1) if self._prefetch else None
+        next_page = None
+        try:
+            while self.has_more and not self._max_results_reached(self.total_items):
+                self.page_num += 1
+
+                if next_page is None:
+                    api_list = self._fetch_page(start_cursor=self.next_cursor, **kwargs)
+                else:
+                    api_list = next_page.result()
+                    next_page = None
+
+                n_items = self.total_items + len(api_list.results)
+                has_next = api_list.has_more and api_list.next_cursor is not None
+                if executor is not None and has_next and not self._max_results_reached(n_items):
+                    next_page = executor.submit(self._fetch_page, start_cursor=api_list.next_cursor, **kwargs)
+
+                for obj in api_list.results:
+                    if self._max_results_reached(self.total_items):
+                        return
+                    self.total_items += 1
+                    yield obj
+
+                self.next_cursor = api_list.next_cursor
+                self.has_more = has_next
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _max_results_reached(self, n_items: int) -> bool:
+        """Return whether `n_items` results are enough to satisfy `max_results`."""
+        return self._max_results is not None and n_items >= self._max_results
+
+    def page(
+        self, *, start_cursor: str | None = None, page_size: int = MAX_PAGE_SIZE, **kwargs: Any
+    ) -> tuple[list[NotionObject], str | None, bool]:
+        """Retrieve only a single page of results.
+
+        Returns the results together with the cursor of the next page and whether there are more results.
+        """
+        api_list = self._fetch_page(start_cursor=start_cursor, page_size=page_size, **kwargs)
+        has_more = api_list.has_more and api_list.next_cursor is not None
+        return api_list.results, api_list.next_cursor, has_more
+
+    def _fetch_page(self, **kwargs: Any) -> ObjectList:
+        """Retrieve a single page of results, waiting and retrying if the rate limit is hit."""
+        retries = 0
+        while True:
+            try:
+                return ObjectList.model_validate(self._endpoint(**kwargs))
+            except APIResponseError as err:
+                if err.code != APIErrorCode.RateLimited or retries >= MAX_RATE_LIMIT_RETRIES:
+                    raise
+                delay = _retry_after(err, default=2**retries)
+                logger.warning('Rate limit of Notion API hit, retrying in %.1f seconds.', delay)
+                time.sleep(delay)
+                retries += 1
+
+
+def _retry_after(err: APIResponseError, default: float) -> float:
+    """Return the number of seconds to wait as requested by the `Retry-After` header."""
+    try:
+        return float(err.headers['Retry-After'])
+    except (KeyError, ValueError):
+        return default
@@ -155,8 +155,11 @@ class ObjectReference(GenericObject):
         Strings may be either UUID's or URL's to Notion content.
         """
 
+        if isinstance(ref, UUID):  # most common case first
+            return cls.model_construct(id=ref)
+
         if isinstance(ref, cls):
-            return ref.model_copy(deep=True)
+            return cls.model_construct(id=ref.id)  # no deep copy needed as the UUID is immutable
 
         if isinstance(ref, ParentRef):
             # ParentRef's are typed-objects with a nested UUID
@@ -164,10 +167,8 @@ class ObjectReference(GenericObject):
 
         if isinstance(ref, GenericObject) and hasattr(ref, 'id'):
             # re-compose the ObjectReference from the internal ID
-            return cls.build(ref.id)
-
-        if isinstance(ref, UUID):
-            return cls.model_construct(id=ref)
+            ref_id = ref.id
+            return cls.model_construct(id=ref_id) if isinstance(ref_id, UUID) else cls.build(ref_id)
 
         if isinstance(ref, str) and (id_str := extract_id(ref)) is not None:
             return cls.model_construct(id=UUID(id_str))
@@ -176,11 +177,15 @@ class ObjectReference(GenericObject):
         raise ValueError(msg)
 
 
-def get_uuid(obj: str | UUID | ParentRef | NotionObject | BlockRef) -> UUID:
+def get_uuid(obj: str | UUID | ParentRef | GenericObject) -> UUID:
     """Retrieves a UUID from an object reference.
 
     Only meant for internal use.
     """
+    if isinstance(obj, UUID):
+        return obj
+    if isinstance(obj, NotionObject) and isinstance(obj_id := obj.id, UUID):  # e.g. blocks, pages, databases
+        return obj_id
     return ObjectReference.build(obj).id
 
 
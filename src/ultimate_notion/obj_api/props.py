@@ -33,7 +33,7 @@ class PropertyValue(TypedObject, polymorphic_base=True):
 
         In practice, this is like calling __init__ with the corresponding keyword.
         """
-        return cls.model_construct(**{cls.model_fields['type'].get_default(): value})
+        return cls.model_construct(**{cls._type_name: value})
 
     def serialize_for_api(self):
         """Serialize the object for sending it to the Notion API."""
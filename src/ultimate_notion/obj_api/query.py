@@ -262,9 +262,11 @@ class QueryBuilder(ABC):
 
     query: Query
     endpoint: NCEndpoint
-    params: dict[str, str]
+    params: dict[str, Any]
+    prefetch: bool = False  # request the next page of results while processing the current one
+    max_results: int | None = None
 
-    def __init__(self, endpoint: NCEndpoint, **params: str | None):
+    def __init__(self, endpoint: NCEndpoint, **params: Any):
         self.endpoint = endpoint
         self.params = {param: value for param, value in params.items() if value is not None}
 
@@ -277,11 +279,25 @@ class QueryBuilder(ABC):
     def limit(self, count: int):
         """Limit the number of results to the given count."""
 
-        self.query.page_size = count
+        self.query.page_size = min(count, MAX_PAGE_SIZE)
+        self.max_results = count
         return self
 
     def execute(self):
         """Execute the current query and return an iterator for the results."""
+        return self._execute(max_results=self.max_results)
+
+    def first(self):
+        """Execute the current query and return the first result only."""
+
+        try:
+            # no further page is requested, not even prefetched, as only the first result is needed
+            return next(self._execute(max_results=1))
+        except StopIteration:
+            logger.debug('iterator returned empty result set')
+
+    def _execute(self, *, max_results):
+        """Execute the current query and return an iterator for at most `max_results` results."""
         logger.debug('executing query - %s', self.query)
 
         # the API doesn't like "undefined" values...
@@ -290,15 +306,7 @@ class QueryBuilder(ABC):
         if self.params:
             query.update(self.params)
 
-        return EndpointIterator(self.endpoint)(**query)
-
-    def first(self):
-        """Execute the current query and return the first result only."""
-
-        try:
-            return next(self.execute())
-        except StopIteration:
-            logger.debug('iterator returned empty result set')
+        return EndpointIterator(self.endpoint, prefetch=self.prefetch, max_results=max_results)(**query)
 
 
 class SearchQueryBuilder(QueryBuilder):
@@ -343,9 +351,18 @@ class DBQueryBuilder(QueryBuilder):
 
     query: DBQuery
 
-    def __init__(self, endpoint, db_id: str):
+    def __init__(self, endpoint, db_id: str, filter_properties: list[str] | None = None, *, prefetch: bool = False):
         self.query = DBQuery()
-        super().__init__(endpoint=endpoint, database_id=db_id)
+        self.prefetch = prefetch
+        super().__init__(endpoint=endpoint, database_id=db_id, filter_properties=filter_properties)
+
+    def select(self, *prop_ids: str) -> DBQueryBuilder:
+        """Only retrieve the properties with the given IDs to reduce the size of the response.
+
+        Notion API: https://developers.notion.com/reference/post-database-query-filter#filter-database-entries
+        """
+        self.params['filter_properties'] = list(prop_ids)
+        return self
 
     def filter(self, condition: QueryFilter) -> DBQueryBuilder:
         """Add the given filter to the query."""
@@ -39,9 +39,11 @@ class Option(Wrapper[objs.SelectOption], wraps=objs.SelectOption):
         return self.name
 
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, Option):
+        if self is other:
+            res = True
+        elif isinstance(other, Option):
             # We compare only the name as the id is not set for new options
-            res = self.name == other.name
+            res = self.obj_ref.name == other.obj_ref.name
         elif other is None:
             res = False
         else:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, TypeGuard, cast
 
 from emoji import is_emoji
@@ -101,13 +102,11 @@ class Page(ChildrenMixin, DataObject[obj_blocks.Page], wraps=obj_blocks.Page):
 
     def _create_prop_attrs(self) -> PageProperties:
         """Create the attributes for the database properties of this page."""
-        # We have to subclass in order to populate it with the descriptor `PageProperty``
-        # as this only works on the class level and we want a unique class for each property.
-        page_props_cls = type('_PageProperties', (PageProperties,), {})
-        if self.parent_db is not None:
-            for prop in self.parent_db.schema.get_props():
-                setattr(page_props_cls, prop.attr_name, PageProperty(prop_name=prop.name))
-        return page_props_cls(page=self)
+        if self.parent_db is None:
+            props_sig: tuple[tuple[str, str], ...] = ()
+        else:
+            props_sig = tuple((prop.attr_name, prop.name) for prop in self.parent_db.schema.get_props())
+        return _page_props_cls(props_sig)(page=self)
 
     def __str__(self) -> str:
         return str(self.title)
@@ -272,3 +271,14 @@ class Page(ChildrenMixin, DataObject[obj_blocks.Page], wraps=obj_blocks.Page):
         self.obj_ref = session.api.pages.retrieve(self.obj_ref.id)
         self._children = None  # this forces a new retrieval of children next time
         return self
+
+
+@lru_cache(maxsize=512)
+def _page_props_cls(props_sig: tuple[tuple[str, str], ...]) -> type[PageProperties]:
+    """Return a subclass of `PageProperties` holding a `PageProperty` descriptor for each property.
+
+    We have to subclass in order to populate it with the descriptor `PageProperty`
+    as this only works on the class level. Pages with the same properties share the class.
+    """
+    attrs = {attr_name: PageProperty(prop_name=prop_name) for attr_name, prop_name in props_sig}
+    return type('_PageProperties', (PageProperties,), attrs)
@@ -8,12 +8,14 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
+from uuid import UUID
 
 import pendulum as pnd
 
 import ultimate_notion.obj_api.props as obj_props
 from ultimate_notion.core import Wrapper, get_active_session, get_repr
 from ultimate_notion.file import FileInfo
+from ultimate_notion.obj_api.objects import get_uuid
 from ultimate_notion.option import Option
 from ultimate_notion.text import RichText
 from ultimate_notion.user import User
@@ -24,6 +26,16 @@ if TYPE_CHECKING:
 T = TypeVar('T', bound=obj_props.PropertyValue)
 
 
+def _as_uuid(obj: object) -> UUID | None:
+    """Return the UUID of an id given as `UUID` or `str` and `None` if `obj` is no valid id."""
+    if not isinstance(obj, UUID | str):
+        return None
+    try:
+        return get_uuid(obj)
+    except ValueError:
+        return None
+
+
 class PropertyValue(Wrapper[T], ABC, wraps=obj_props.PropertyValue):  # noqa: PLW1641
     """Base class for Notion property values.
 
@@ -35,9 +47,7 @@ class PropertyValue(Wrapper[T], ABC, wraps=obj_props.PropertyValue):  # noqa: PL
 
     def __init_subclass__(cls, wraps: type[T], **kwargs: Any):
         super().__init_subclass__(wraps=wraps, **kwargs)
-        # at that time the model is not yet constructed, thus no direct field acces with .type.
-        type_name = wraps.model_fields['type'].get_default()
-        cls._type_value_map[type_name] = cls
+        cls._type_value_map[wraps._type_name] = cls
 
     @property
     def _obj_api_type(self) -> type[obj_props.PropertyValue]:
@@ -52,9 +62,12 @@ class PropertyValue(Wrapper[T], ABC, wraps=obj_props.PropertyValue):  # noqa: PL
         super().__init__(values)
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, PropertyValue):
             return NotImplemented
-        return self.obj_ref.type == other.obj_ref.type and self.obj_ref.value == self.obj_ref.value
+        # we compare the high-level values as the low-level objects differ in details like ids after a roundtrip
+        return self.obj_ref.type == other.obj_ref.type and self.value == other.value
 
     @property
     @abstractmethod
@@ -69,13 +82,13 @@ class PropertyValue(Wrapper[T], ABC, wraps=obj_props.PropertyValue):  # noqa: PL
         return get_repr(self)
 
     def __str__(self) -> str:
-        if isinstance(self.value, RichText):
-            return str(self.value) if self.value else ''
-        elif isinstance(self.value, list):
+        value = self.value  # evaluate only once as e.g. `RichText` values are constructed on access
+        if isinstance(value, list):
             # workaround as `str` on lists calls `repr` instead of `str`
-            return ', '.join(str(val) for val in self.value)
+            # note that `str.join` creates a list from a generator anyway, so we pass one directly
+            return ', '.join([str(val) for val in value])
         else:
-            return str(self.value) if self.value else ''
+            return str(value) if value else ''
 
 
 class Title(PropertyValue[obj_props.Title], wraps=obj_props.Title):
@@ -173,30 +186,67 @@ class Select(PropertyValue[obj_props.Select], wraps=obj_props.Select):
 class MultiSelect(PropertyValue[obj_props.MultiSelect], wraps=obj_props.MultiSelect):
     """Multi-select property value."""
 
+    _option_names: frozenset[str] | None = None
+    _options: list[Option] | None = None
+
     def __init__(self, options: str | Option | list[str | Option]):
         if not isinstance(options, list):
             options = [options]
-        options = [Option(option) if isinstance(option, str) else option for option in options]
-        super().__init__(options)
+        # remove duplicates by name in a single pass while keeping the order of the first occurrences
+        unique_options: dict[str, Option] = {}
+        for option in options:
+            name = option.name if isinstance(option, Option) else option
+            if name not in unique_options:
+                unique_options[name] = Option(option) if isinstance(option, str) else option
+        super().__init__(list(unique_options.values()))
+
+    def __contains__(self, option: object) -> bool:
+        """Check if an option, given as `Option` or by its name, is selected."""
+        if self._option_names is None:  # generate cache
+            self._option_names = frozenset(opt.name for opt in self.obj_ref.multi_select or [])
+        name = option.name if isinstance(option, Option) else option
+        return name in self._option_names
 
     @property
     def value(self) -> list[Option] | None:
-        if self.obj_ref.multi_select:
-            return [Option.wrap_obj_ref(option) for option in self.obj_ref.multi_select]
-        else:
+        if not self.obj_ref.multi_select:
             return None
+        if self._options is None:  # generate cache
+            self._options = [Option.wrap_obj_ref(option) for option in self.obj_ref.multi_select]
+        return self._options.copy()
+
+    def __str__(self) -> str:
+        # join the names directly instead of wrapping each option first
+        return ', '.join(option.name for option in self.obj_ref.multi_select or [])
 
 
-class People(PropertyValue[obj_props.People], wraps=obj_props.People):
+class People(PropertyValue[obj_props.People], wraps=obj_props.People):  # noqa: PLW1641
     """People property value."""
 
+    _user_ids: frozenset[UUID] | None = None
+
     def __init__(self, users: User | list[User]):
         if not isinstance(users, list):
             users = [users]
         super().__init__(users)
 
+    def __contains__(self, user: object) -> bool:
+        """Check if a user, given as `User` or by its id, is contained without retrieving all users."""
+        if self._user_ids is None:  # generate cache
+            self._user_ids = frozenset(user_obj.id for user_obj in self.obj_ref.people or [])
+        user_id = user.id if isinstance(user, User) else _as_uuid(user)
+        return user_id in self._user_ids
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, People):
+            return super().__eq__(other)
+        # compare the ids to avoid retrieving all users
+        return [user.id for user in self.obj_ref.people or []] == [user.id for user in other.obj_ref.people or []]
+
     @property
     def value(self) -> list[User]:
+        if not self.obj_ref.people:  # no session needed, e.g. for `str` of an empty value
+            return []
         session = get_active_session()
         return [session.get_user(user.id) for user in self.obj_ref.people]
 
@@ -228,12 +278,20 @@ class PhoneNumber(PropertyValue[obj_props.PhoneNumber], wraps=obj_props.PhoneNum
 class Files(PropertyValue[obj_props.Files], wraps=obj_props.Files):
     """Files property value."""
 
+    _file_urls: frozenset[str] | None = None
+
     def __init__(self, files: FileInfo | list[FileInfo]):
         if not isinstance(files, list):
             files = [files]
 
         super().__init__(files)
 
+    def __contains__(self, file: object) -> bool:
+        """Check if a file, given as `FileInfo` or by its URL, is contained."""
+        if self._file_urls is None:  # generate cache
+            self._file_urls = frozenset(str(file_info) for file_info in self.value)
+        return str(file) in self._file_urls if isinstance(file, FileInfo | str) else False
+
     @property
     def value(self) -> list[FileInfo]:
         return [FileInfo.wrap_obj_ref(file) for file in self.obj_ref.files]
@@ -250,16 +308,33 @@ class Formula(PropertyValue[obj_props.Formula], wraps=obj_props.Formula):
         return self.obj_ref.formula.value if self.obj_ref.formula else None
 
 
-class Relations(PropertyValue[obj_props.Relation], wraps=obj_props.Relation):
+class Relations(PropertyValue[obj_props.Relation], wraps=obj_props.Relation):  # noqa: PLW1641
     """Relation property value."""
 
+    _page_ids: frozenset[UUID] | None = None
+
     def __init__(self, pages: Page | list[Page]):
         if not isinstance(pages, list):
             pages = [pages]
         super().__init__(pages)
 
+    def __contains__(self, page: object) -> bool:
+        """Check if a page, given as `Page` or by its id, is related without retrieving all pages."""
+        if self._page_ids is None:  # generate cache
+            self._page_ids = frozenset(ref_obj.id for ref_obj in self.obj_ref.relation or [])
+        page_id = page.obj_ref.id if isinstance(page, Wrapper) else _as_uuid(page)
+        return page_id in self._page_ids
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Relations):
+            return super().__eq__(other)
+        # compare the ids to avoid retrieving all pages
+        return [ref.id for ref in self.obj_ref.relation or []] == [ref.id for ref in other.obj_ref.relation or []]
+
     @property
     def value(self) -> list[Page]:
+        if not self.obj_ref.relation:  # no session needed, e.g. for `str` of an empty value
+            return []
         session = get_active_session()
         return [session.get_page(ref_obj.id) for ref_obj in self.obj_ref.relation]
 
@@ -69,6 +69,7 @@ class PageSchema:
     db_title: RichText | None
     db_desc: RichText | None
     _database: Database | None = None
+    _attr_prop_map: dict[str, Property]
 
     def __init_subclass__(cls, db_title: RichText | str | None, **kwargs: Any):
         if isinstance(db_title, str):
@@ -107,6 +108,16 @@ class PageSchema:
         """Get all properties of this schema."""
         return [prop for prop in cls.__dict__.values() if isinstance(prop, Property)]
 
+    @classmethod
+    def _get_attr_prop_map(cls) -> dict[str, Property]:
+        """Get the mapping from Python attribute names to the properties of this schema.
+
+        The mapping is computed only once per schema class as the properties don't change after class creation.
+        """
+        if '_attr_prop_map' not in cls.__dict__:  # don't use the map of a parent schema
+            cls._attr_prop_map = {prop.attr_name: prop for prop in cls.get_props()}
+        return cls._attr_prop_map
+
     @classmethod
     def get_prop(cls, prop_name: str) -> Property:
         """Get a specific property from this schema assuming that property names are unique."""
@@ -13,7 +13,7 @@ import notion_client
 from httpx import ConnectError
 from notion_client.errors import APIResponseError
 
-from ultimate_notion.blocks import Block, DataObject
+from ultimate_notion.blocks import Block, ChildDatabase, ChildPage, DataObject
 from ultimate_notion.config import Config, get_cfg_file, get_or_create_cfg
 from ultimate_notion.database import Database
 from ultimate_notion.obj_api.endpoints import NotionAPI
@@ -305,7 +305,18 @@ class Session:
         """Retrieve all users of this workspace."""
         return [cast(User, self.cache.setdefault(user.id, User.wrap_obj_ref(user))) for user in self.api.users.list()]
 
-    def get_block(self, block_ref: UUID | str) -> Block:
-        """Retrieve a single block by an object reference."""
+    def get_block(self, block_ref: UUID | str, *, use_cache: bool = False) -> Block:
+        """Retrieve a single block by an object reference.
+
+        With `use_cache`, a block retrieved before is returned from the cache. This is opt-in as cached blocks
+        are not updated when they are changed elsewhere. Child pages and databases are not cached as blocks
+        since their ids are the ones of the actual pages and databases, which are cached by `get_page` and `get_db`.
+        """
         block_uuid = get_uuid(block_ref)
-        return Block.wrap_obj_ref(self.api.blocks.retrieve(block_uuid))
+        if use_cache and isinstance(block := self.cache.get(block_uuid), Block):
+            return block
+        else:
+            block = Block.wrap_obj_ref(self.api.blocks.retrieve(block_uuid))
+            if not isinstance(block, ChildPage | ChildDatabase):
+                self.cache[block.id] = block
+            return block
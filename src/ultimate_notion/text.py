@@ -5,6 +5,7 @@ from __future__ import annotations
 import datetime as dt
 import re
 from collections.abc import Callable, Iterator
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar, cast
 from urllib.parse import urlparse
 
@@ -28,6 +29,9 @@ MAX_TEXT_OBJECT_SIZE = 2000
 """The max text size according to the Notion API is 2000 characters."""
 
 
+INVALID_IDENTIFIER_CHARS_RE = re.compile(r'[^0-9a-zA-Z_]+')
+INVALID_IDENTIFIER_START_RE = re.compile(r'^[^a-zA-Z]+')
+
 MD_STYLES = ('bold', 'italic', 'strikethrough', 'code', 'link')
 """Markdown styles supported by Notion."""
 MD_STYLE_MAP = {
@@ -155,28 +159,34 @@ class RichText(str):
     """User-facing class holding several RichTextsBase objects."""
 
     _rich_texts: list[RichTextBase]
+    _obj_refs: list[objs.RichTextBaseObject]
 
     def __init__(self, plain_text: str):
         # note that super().__new__ stores the plain text in the object for `str(self)`
         super().__init__()
 
-        rich_texts: list[RichTextBase] = []
-        for part in chunky(plain_text):
-            rich_texts.append(Text(part))
+        rich_texts: list[RichTextBase]
+        if len(plain_text) <= MAX_TEXT_OBJECT_SIZE:  # fast path for the common case of a short text
+            rich_texts = [Text(plain_text)] if plain_text else []
+        else:
+            rich_texts = [Text(part) for part in chunky(plain_text)]
         self._rich_texts = rich_texts
+        self._obj_refs = [text.obj_ref for text in rich_texts]
 
     @classmethod
     def wrap_obj_ref(cls, obj_refs: list[objs.RichTextBaseObject] | None) -> RichText:
-        obj_refs = [] if obj_refs is None else obj_refs
-        rich_texts = [cast(RichTextBase, RichTextBase.wrap_obj_ref(obj_ref)) for obj_ref in obj_refs]
-        plain_text = ''.join(text.obj_ref.plain_text for text in rich_texts if text)
-        obj = cls(plain_text)
-        obj._rich_texts = rich_texts
+        obj_refs = [] if obj_refs is None else list(obj_refs)
+        plain_text = ''.join(obj_ref.plain_text for obj_ref in obj_refs)
+        # bypass __init__ as the rich texts are given and need not be built from the plain text
+        obj = cls.__new__(cls, plain_text)
+        obj._rich_texts = [cast(RichTextBase, RichTextBase.wrap_obj_ref(obj_ref)) for obj_ref in obj_refs]
+        obj._obj_refs = obj_refs
         return obj
 
     @property
     def obj_ref(self) -> list[objs.RichTextBaseObject]:
-        return [elem.obj_ref for elem in self._rich_texts]
+        # RichText is immutable, so we only hand out a shallow copy of the stored list
+        return self._obj_refs.copy()
 
     @classmethod
     def from_markdown(cls, text: str) -> RichText:
@@ -213,15 +223,15 @@ class RichText(str):
         return self.to_html()
 
     def __eq__(self, other: object) -> bool:
+        # compare the stored plain text directly, `str(self)` would create a copy on every call
         if isinstance(other, str):
-            return str(self) == other
-        elif isinstance(other, RichText):
-            return str(self) == str(other)
+            return str.__eq__(self, other)
         else:
             return NotImplemented
 
     def __hash__(self):
-        return hash(str(self))
+        # the hash of the stored plain text is computed once and cached by `str` itself
+        return str.__hash__(self)
 
     def __add__(self, other: RichTextBase | RichText | str) -> RichText:
         if isinstance(other, RichTextBase):
@@ -261,6 +271,7 @@ def chunky(text: str, length: int = MAX_TEXT_OBJECT_SIZE) -> Iterator[str]:
     return (text[idx : idx + length] for idx in range(0, len(text), length))
 
 
+@lru_cache(maxsize=4096)
 def python_identifier(string: str) -> str:
     """Make a valid Python identifier.
 
@@ -269,8 +280,8 @@ def python_identifier(string: str) -> str:
 
     Attention: This may result in an empty string!
     """
-    s = re.sub(r'[^0-9a-zA-Z_]+', '_', string)
-    s = re.sub(r'^[^a-zA-Z]+', '', s)
+    s = INVALID_IDENTIFIER_CHARS_RE.sub('_', string)
+    s = INVALID_IDENTIFIER_START_RE.sub('', s)
     return s.rstrip('_')
 
 
@@ -479,11 +490,10 @@ def join(texts: list[AnyText], *, delim: str | AnyText = ' ') -> RichText:
     if len(texts) == 0:
         return RichText.wrap_obj_ref([])
 
-    if isinstance(delim, str):
-        delim_obj = text_to_obj_ref(delim)
-
+    delim_objs = text_to_obj_ref(delim)
     all_objs = text_to_obj_ref(texts[0])
     for text in texts[1:]:
-        all_objs.extend([*delim_obj, *text_to_obj_ref(text)])
+        all_objs.extend(delim_objs)
+        all_objs.extend(text_to_obj_ref(text))
 
     return RichText.wrap_obj_ref(all_objs)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import cast
+from uuid import UUID
 
 from ultimate_notion.core import Wrapper, get_repr
 from ultimate_notion.obj_api import objects as objs
@@ -11,10 +12,16 @@ from ultimate_notion.obj_api import objects as objs
 class User(Wrapper[objs.User], wraps=objs.User):
     """User object for persons and bots."""
 
+    _id: UUID
+    _name: str | None
+
     @classmethod
     def wrap_obj_ref(cls, obj_ref: objs.User) -> User:
         self = cast(User, cls.__new__(cls))
         self.obj_ref = obj_ref
+        # users are immutable, so we store id and name for fast hashing and comparisons
+        self._id = obj_ref.id
+        self._name = obj_ref.name
         return self
 
     def __str__(self):
@@ -24,20 +31,22 @@ class User(Wrapper[objs.User], wraps=objs.User):
         return get_repr(self)
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, User):
             return NotImplemented
-        return self.id == other.id
+        return self._id == other._id
 
     def __hash__(self) -> int:
-        return hash(self.id)
+        return hash(self._id)
 
     @property
-    def id(self):
-        return self.obj_ref.id
+    def id(self) -> UUID:
+        return self._id
 
     @property
-    def name(self):
-        return self.obj_ref.name
+    def name(self) -> str | None:
+        return self._name
 
     @property
     def is_person(self) -> bool:
@@ -325,5 +325,5 @@ class View:
     def reload(self) -> View:
         """Reload all pages by re-executing the query that generated the view."""
         view = self.clone()
-        view._pages = np.array(self.database._pages_from_query(query=self._query))
+        view._pages = np.array(list(self.database._pages_from_query(query=self._query)))
         return view
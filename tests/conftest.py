@@ -30,6 +30,7 @@ from functools import wraps
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
+from uuid import UUID
 
 import pytest
 from _pytest.fixtures import SubRequest
@@ -58,6 +59,102 @@ MD_SUBPAGE_TEST_PAGE = 'Markdown SubPage Test'
 TASK_DB = 'Task DB'
 UNFURL_TEST_PAGE = 'Embed/Inline & Unfurl'
 
+# Options and formulas of the task list created by `new_task_db`
+TASK_STATUS_OPTIONS = [
+    Option('Backlog', color=uno.Color.GRAY),
+    Option('In Progres', color=uno.Color.BLUE),
+    Option('Blocked', color=uno.Color.RED),
+    Option('Done', color=uno.Color.GREEN),
+    Option('Rejected', color=uno.Color.BROWN),
+]
+TASK_PRIORITY_OPTIONS = [
+    Option('✹ High', color=uno.Color.RED),
+    Option('✷ Medium', color=uno.Color.YELLOW),
+    Option('✶ Low', color=uno.Color.GRAY),
+]
+TASK_REPEATS_OPTIONS = [
+    Option('Daily', color=uno.Color.GRAY),
+    Option('Weekly', color=uno.Color.PINK),
+    Option('Bi-weekly', color=uno.Color.BROWN),
+    Option('Monthly', color=uno.Color.ORANGE),
+    Option('Bi-monthly', color=uno.Color.YELLOW),
+    Option('Tri-monthly', color=uno.Color.GREEN),
+    Option('Quarterly', color=uno.Color.BLUE),
+    Option('Bi-annually', color=uno.Color.PURPLE),
+    Option('Yearly', color=uno.Color.RED),
+]
+TASK_DONE_FORMULA = 'prop("Status") == "Done"'
+TASK_DUE_FORMULA = (
+    'if(or(prop("Due Date") >= dateSubtract(dateSubtract(now(), hour(now()), "hours"), minute(now()), "minutes"), '
+    'empty(prop("Repeats"))), prop("Due Date"), (if((prop("Repeats") == "Daily"), '
+    'dateAdd(dateAdd(dateSubtract(dateAdd(dateAdd(dateSubtract(dateSubtract(prop("Due Date"), '
+    'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, "days"), '
+    'dateBetween(now(), dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), '
+    'minute(prop("Due Date")), "minutes"), 1, "days"), "days") + 1, "days"), 1, "days"), '
+    'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), (if((prop("Repeats") == "Weekly"), '
+    'dateAdd(dateAdd(dateSubtract(dateAdd(dateAdd(dateSubtract(dateSubtract(prop("Due Date"), '
+    'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, "days"), '
+    'dateBetween(now(), dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), '
+    'minute(prop("Due Date")), "minutes"), 1, "days"), "weeks") + 1, "weeks"), 1, "days"), '
+    'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), '
+    '(if((prop("Repeats") == "Bi-weekly"), dateAdd(dateAdd(dateSubtract(dateAdd(dateAdd(dateSubtract('
+    'dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, '
+    '"days"), (dateBetween(now(), dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), '
+    '"hours"), minute(prop("Due Date")), "minutes"), 1, "days"), "weeks") - (dateBetween(now(), '
+    'dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), '
+    'minute(prop("Due Date")), "minutes"), 1, "days"), "weeks") % 2)) + 2, "weeks"), 1, "days"), '
+    'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), (if((prop("Repeats") == "Monthly"), '
+    'dateAdd(dateAdd(dateSubtract(dateAdd(dateAdd(dateSubtract(dateSubtract(prop("Due Date"), '
+    'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, "days"), dateBetween(now(), '
+    'dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), '
+    'minute(prop("Due Date")), "minutes"), 1, "days"), "months") + 1, "months"), 1, "days"), '
+    'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), '
+    '(if((prop("Repeats") == "Bi-monthly"), dateAdd(dateAdd(dateSubtract(dateAdd(dateAdd(dateSubtract('
+    'dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, '
+    '"days"), (dateBetween(now(), dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), '
+    '"hours"), minute(prop("Due Date")), "minutes"), 1, "days"), "months") - (dateBetween(now(), '
+    'prop("Due Date"), "months") % 2)) + 2, "months"), 1, "days"), hour(prop("Due Date")), "hours"), '
+    'minute(prop("Due Date")), "minutes"), (if((prop("Repeats") == "Tri-monthly"), dateAdd(dateAdd(dateSubtract('
+    'dateAdd(dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), '
+    'minute(prop("Due Date")), "minutes"), 1, "days"), (dateBetween(now(), dateAdd(dateSubtract(dateSubtract('
+    'prop("Due Date"), hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, "days"), '
+    '"months") - (dateBetween(now(), prop("Due Date"), "months") % 3)) + 3, "months"), 1, "days"), '
+    'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), (if((prop("Repeats") == '
+    '"Quarterly"), dateAdd(dateAdd(dateSubtract(dateAdd(dateAdd(dateSubtract(dateSubtract(prop("Due Date"), '
+    'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, "days"), (dateBetween(now(), '
+    'dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), minute('
+    'prop("Due Date")), "minutes"), 1, "days"), "months") - (dateBetween(now(), prop("Due Date"), "months") % 4)) '
+    '+ 4, "months"), 1, "days"), hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), '
+    '(if((prop("Repeats") == "Bi-annually"), dateSubtract(dateAdd(dateAdd(dateSubtract(dateAdd(dateAdd('
+    'dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), minute(prop("Due Date")), '
+    '"minutes"), 1, "days"), (dateBetween(now(), dateAdd(dateSubtract(dateSubtract(prop("Due Date"), '
+    'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, "days"), "months") - '
+    '(dateBetween(now(), prop("Due Date"), "months") % 6)) + 6, "months"), 1, "months"), hour(prop("Due Date")), '
+    '"hours"), minute(prop("Due Date")), "minutes"), 1, "days"), (if((prop("Repeats") == "Yearly"), dateAdd('
+    'dateAdd(dateSubtract(dateAdd(dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), '
+    '"hours"), minute(prop("Due Date")), "minutes"), 1, "days"), dateBetween(now(), dateAdd(dateSubtract('
+    'dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, '
+    '"days"), "years") + 1, "years"), 1, "days"), hour(prop("Due Date")), "hours"), minute(prop("Due Date")), '
+    '"minutes"), fromTimestamp(toNumber("")))))))))))))))))))))'
+)
+TASK_D_LEFT_FORMULA = (
+    f'if(empty(({TASK_DUE_FORMULA})), toNumber(""), '
+    f'(if((({TASK_DUE_FORMULA}) > now()), (dateBetween(({TASK_DUE_FORMULA}), now(), "days") + 1), '
+    f'dateBetween(({TASK_DUE_FORMULA}), now(), "days"))))'
+)
+TASK_W_LEFT_FORMULA = f'(if((({TASK_D_LEFT_FORMULA}) < 0), -1, 1)) * floor(abs(({TASK_D_LEFT_FORMULA}) / 7))'
+TASK_T_LEFT_FORMULA = (
+    f'if(empty(({TASK_D_LEFT_FORMULA})), "", (((if((({TASK_D_LEFT_FORMULA}) < 0), "-", "")) + '
+    f'(if((({TASK_W_LEFT_FORMULA}) == 0), "", (format(abs(({TASK_W_LEFT_FORMULA}))) + "w")))) + '
+    f'(if(((({TASK_D_LEFT_FORMULA}) % 7) == 0), "", (format(abs(({TASK_D_LEFT_FORMULA})) % 7) + "d")))))'
+)
+TASK_URGENCY_FORMULA = (
+    f'if(({TASK_DONE_FORMULA}), "✅ Done", (if(empty(prop("Due Date")), "", '
+    f'(if((formatDate(now(), "YWD") == formatDate(({TASK_DUE_FORMULA}), "YWD")), "🔹 Today", '
+    f'(if((now() > ({TASK_DUE_FORMULA})), ("🔥 " + ({TASK_T_LEFT_FORMULA})), '
+    f'("🕐 " + ({TASK_T_LEFT_FORMULA})))))))))'
+)
+
 # Original configuration file for the tests. The environment variables will be altered in some tests temporarily.
 TEST_CFG_FILE = get_cfg_file()
 
@@ -85,13 +182,20 @@ def vcr_config():
         'user-agent',
     ]
 
-    def remove_secrets(response: dict[str, dict[str, str]]):
+    secret_keys = tuple(f'"{secret}"' for secret in secret_params)  # as they appear in a JSON body
+
+    def remove_secrets(response: dict[str, dict[str, str | bytes]]):
         for secret in secret_params:
             response['headers'].pop(secret, None)
         if 'body' in response and 'string' in response['body']:
+            body = response['body']['string']
+            text = body.decode(errors='replace') if isinstance(body, bytes) else body
+            # skip parsing & re-serializing bodies without any secrets, i.e. most responses of the Notion API
+            if not any(key in text for key in secret_keys):
+                return response
             try:
                 # remove secret tokens from body in Google API calls
-                dct = json.loads(response['body']['string'])
+                dct = json.loads(body)
                 for secret in secret_params:
                     if secret in dct:
                         dct[secret] = 'secret...'
@@ -324,9 +428,9 @@ def unfurl_page(notion: Session) -> Page:
 @pytest.fixture(scope='module')
 def static_pages(  # noqa: PLR0917
     root_page: Page, intro_page: Page, md_text_page: Page, md_page: Page, md_subpage: Page, unfurl_page: Page
-) -> set[Page]:
-    """Return all static pages for the unit tests."""
-    return {intro_page, root_page, md_text_page, md_page, md_subpage, unfurl_page}
+) -> frozenset[UUID]:
+    """Return the ids of all static pages for the unit tests."""
+    return frozenset(page.id for page in (intro_page, root_page, md_text_page, md_page, md_subpage, unfurl_page))
 
 
 @vcr_fixture(scope='module')
@@ -336,120 +440,25 @@ def task_db(notion: Session) -> Database:
 
 
 @vcr_fixture(scope='module')
-def static_dbs(all_props_db: Database, wiki_db: Database, contacts_db: Database, task_db: Database) -> set[Database]:
-    """Return all static pages for the unit tests."""
-    return {all_props_db, wiki_db, contacts_db, task_db}
+def static_dbs(all_props_db: Database, wiki_db: Database, contacts_db: Database, task_db: Database) -> frozenset[UUID]:
+    """Return the ids of all static databases for the unit tests."""
+    return frozenset(db.id for db in (all_props_db, wiki_db, contacts_db, task_db))
 
 
 @pytest.fixture(scope='function')
 def new_task_db(notion: Session, root_page: Page) -> Iterator[Database]:
-    status_options = [
-        Option('Backlog', color=uno.Color.GRAY),
-        Option('In Progres', color=uno.Color.BLUE),
-        Option('Blocked', color=uno.Color.RED),
-        Option('Done', color=uno.Color.GREEN),
-        Option('Rejected', color=uno.Color.BROWN),
-    ]
-    priority_options = [
-        Option('✹ High', color=uno.Color.RED),
-        Option('✷ Medium', color=uno.Color.YELLOW),
-        Option('✶ Low', color=uno.Color.GRAY),
-    ]
-    repeats_options = [
-        Option('Daily', color=uno.Color.GRAY),
-        Option('Weekly', color=uno.Color.PINK),
-        Option('Bi-weekly', color=uno.Color.BROWN),
-        Option('Monthly', color=uno.Color.ORANGE),
-        Option('Bi-monthly', color=uno.Color.YELLOW),
-        Option('Tri-monthly', color=uno.Color.GREEN),
-        Option('Quarterly', color=uno.Color.BLUE),
-        Option('Bi-annually', color=uno.Color.PURPLE),
-        Option('Yearly', color=uno.Color.RED),
-    ]
-    done_formula = 'prop("Status") == "Done"'
-    due_formula = (
-        'if(or(prop("Due Date") >= dateSubtract(dateSubtract(now(), hour(now()), "hours"), minute(now()), "minutes"), '
-        'empty(prop("Repeats"))), prop("Due Date"), (if((prop("Repeats") == "Daily"), '
-        'dateAdd(dateAdd(dateSubtract(dateAdd(dateAdd(dateSubtract(dateSubtract(prop("Due Date"), '
-        'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, "days"), '
-        'dateBetween(now(), dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), '
-        'minute(prop("Due Date")), "minutes"), 1, "days"), "days") + 1, "days"), 1, "days"), '
-        'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), (if((prop("Repeats") == "Weekly"), '
-        'dateAdd(dateAdd(dateSubtract(dateAdd(dateAdd(dateSubtract(dateSubtract(prop("Due Date"), '
-        'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, "days"), '
-        'dateBetween(now(), dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), '
-        'minute(prop("Due Date")), "minutes"), 1, "days"), "weeks") + 1, "weeks"), 1, "days"), '
-        'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), '
-        '(if((prop("Repeats") == "Bi-weekly"), dateAdd(dateAdd(dateSubtract(dateAdd(dateAdd(dateSubtract('
-        'dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, '
-        '"days"), (dateBetween(now(), dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), '
-        '"hours"), minute(prop("Due Date")), "minutes"), 1, "days"), "weeks") - (dateBetween(now(), '
-        'dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), '
-        'minute(prop("Due Date")), "minutes"), 1, "days"), "weeks") % 2)) + 2, "weeks"), 1, "days"), '
-        'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), (if((prop("Repeats") == "Monthly"), '
-        'dateAdd(dateAdd(dateSubtract(dateAdd(dateAdd(dateSubtract(dateSubtract(prop("Due Date"), '
-        'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, "days"), dateBetween(now(), '
-        'dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), '
-        'minute(prop("Due Date")), "minutes"), 1, "days"), "months") + 1, "months"), 1, "days"), '
-        'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), '
-        '(if((prop("Repeats") == "Bi-monthly"), dateAdd(dateAdd(dateSubtract(dateAdd(dateAdd(dateSubtract('
-        'dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, '
-        '"days"), (dateBetween(now(), dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), '
-        '"hours"), minute(prop("Due Date")), "minutes"), 1, "days"), "months") - (dateBetween(now(), '
-        'prop("Due Date"), "months") % 2)) + 2, "months"), 1, "days"), hour(prop("Due Date")), "hours"), '
-        'minute(prop("Due Date")), "minutes"), (if((prop("Repeats") == "Tri-monthly"), dateAdd(dateAdd(dateSubtract('
-        'dateAdd(dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), '
-        'minute(prop("Due Date")), "minutes"), 1, "days"), (dateBetween(now(), dateAdd(dateSubtract(dateSubtract('
-        'prop("Due Date"), hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, "days"), '
-        '"months") - (dateBetween(now(), prop("Due Date"), "months") % 3)) + 3, "months"), 1, "days"), '
-        'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), (if((prop("Repeats") == '
-        '"Quarterly"), dateAdd(dateAdd(dateSubtract(dateAdd(dateAdd(dateSubtract(dateSubtract(prop("Due Date"), '
-        'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, "days"), (dateBetween(now(), '
-        'dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), minute('
-        'prop("Due Date")), "minutes"), 1, "days"), "months") - (dateBetween(now(), prop("Due Date"), "months") % 4)) '
-        '+ 4, "months"), 1, "days"), hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), '
-        '(if((prop("Repeats") == "Bi-annually"), dateSubtract(dateAdd(dateAdd(dateSubtract(dateAdd(dateAdd('
-        'dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), minute(prop("Due Date")), '
-        '"minutes"), 1, "days"), (dateBetween(now(), dateAdd(dateSubtract(dateSubtract(prop("Due Date"), '
-        'hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, "days"), "months") - '
-        '(dateBetween(now(), prop("Due Date"), "months") % 6)) + 6, "months"), 1, "months"), hour(prop("Due Date")), '
-        '"hours"), minute(prop("Due Date")), "minutes"), 1, "days"), (if((prop("Repeats") == "Yearly"), dateAdd('
-        'dateAdd(dateSubtract(dateAdd(dateAdd(dateSubtract(dateSubtract(prop("Due Date"), hour(prop("Due Date")), '
-        '"hours"), minute(prop("Due Date")), "minutes"), 1, "days"), dateBetween(now(), dateAdd(dateSubtract('
-        'dateSubtract(prop("Due Date"), hour(prop("Due Date")), "hours"), minute(prop("Due Date")), "minutes"), 1, '
-        '"days"), "years") + 1, "years"), 1, "days"), hour(prop("Due Date")), "hours"), minute(prop("Due Date")), '
-        '"minutes"), fromTimestamp(toNumber("")))))))))))))))))))))'
-    )
-    d_left_formula = (
-        f'if(empty(({due_formula})), toNumber(""), '
-        f'(if((({due_formula}) > now()), (dateBetween(({due_formula}), now(), "days") + 1), '
-        f'dateBetween(({due_formula}), now(), "days"))))'
-    )
-    w_left_formula = f'(if((({d_left_formula}) < 0), -1, 1)) * floor(abs(({d_left_formula}) / 7))'
-    t_left_formula = (
-        f'if(empty(({d_left_formula})), "", (((if((({d_left_formula}) < 0), "-", "")) + '
-        f'(if((({w_left_formula}) == 0), "", (format(abs(({w_left_formula}))) + "w")))) + '
-        f'(if(((({d_left_formula}) % 7) == 0), "", (format(abs(({d_left_formula})) % 7) + "d")))))'
-    )
-    urgency_formula = (
-        f'if(({done_formula}), "✅ Done", (if(empty(prop("Due Date")), "", '
-        f'(if((formatDate(now(), "YWD") == formatDate(({due_formula}), "YWD")), "🔹 Today", '
-        f'(if((now() > ({due_formula})), ("🔥 " + ({t_left_formula})), '
-        f'("🕐 " + ({t_left_formula})))))))))'
-    )
-
     class Tasklist(schema.PageSchema, db_title='My Tasks'):
         """My personal task list"""
 
         task = schema.Property('Task', schema.Title())
-        status = schema.Property('Status', schema.Select(status_options))
-        priority = schema.Property('Priority', schema.Select(priority_options))
-        urgency = schema.Property('Urgency', schema.Formula(urgency_formula))
+        status = schema.Property('Status', schema.Select(TASK_STATUS_OPTIONS))
+        priority = schema.Property('Priority', schema.Select(TASK_PRIORITY_OPTIONS))
+        urgency = schema.Property('Urgency', schema.Formula(TASK_URGENCY_FORMULA))
         started = schema.Property('Started', schema.Date())
         due_date = schema.Property('Due Date', schema.Date())
-        due_by = schema.Property('Due by', schema.Formula(due_formula))
-        done = schema.Property('Done', schema.Formula(done_formula))
-        repeats = schema.Property('Repeats', schema.Select(repeats_options))
+        due_by = schema.Property('Due by', schema.Formula(TASK_DUE_FORMULA))
+        done = schema.Property('Done', schema.Formula(TASK_DONE_FORMULA))
+        repeats = schema.Property('Repeats', schema.Select(TASK_REPEATS_OPTIONS))
         url = schema.Property('URL', schema.URL())
         # ToDo: Reintroduce after the problem with adding a two-way relation property is fixed in the Notion API
         # parent = schema.Property('Parent Task', schema.Relation(schema.SelfRef))
@@ -460,26 +469,28 @@ def new_task_db(notion: Session, root_page: Page) -> Iterator[Database]:
     db.delete()
 
 
-@vcr_fixture(scope='module', autouse=True)
-def notion_cleanups(notion: Session, root_page: Page, static_pages: set[Page], static_dbs: set[Database]):
+@vcr_fixture(scope='module')
+def notion_cleanups(notion: Session, root_page: Page, static_pages: frozenset[UUID], static_dbs: frozenset[UUID]):
     """Delete all databases and pages in the root_page after we ran except of some special dbs and their content.
 
     Be careful! This fixture opens a Notion session, which might lead to problems if you run it in parallel with other.
     Overwrite it in a a test module to avoid this behavior.
+    It is used automatically by all modules with tests marked with `vcr`, see `auto_notion_cleanups`.
     """
 
     def clean():
         for db in notion.search_db():
-            if db.ancestors[0] == root_page and db not in static_dbs:
+            # check the static dbs first to avoid walking up the ancestors
+            if db.id not in static_dbs and db.ancestors[0] == root_page:
                 db.delete()
         for page in notion.search_page():
-            if page in static_pages:
+            if page.id in static_pages:
                 continue
             ancestors = page.ancestors
             if (
                 ancestors
                 and ancestors[0] == root_page
-                and page.parent_db not in static_dbs
+                and ancestors[-1].id not in static_dbs  # last ancestor is the parent, i.e. `page.parent_db` if any
                 and not any(p.is_deleted for p in ancestors)  # skip if any ancestor was already deleted
             ):
                 page.delete()
@@ -489,6 +500,17 @@ def notion_cleanups(notion: Session, root_page: Page, static_pages: set[Page], s
     clean()
 
 
+@pytest.fixture(scope='module', autouse=True)
+def auto_notion_cleanups(request: SubRequest):
+    """Use `notion_cleanups` only in modules with tests marked with `vcr`, i.e. tests using the Notion API.
+
+    This avoids opening a Notion session and scanning the whole workspace for pure unit tests.
+    """
+    module = request.node
+    if any(item.get_closest_marker('vcr') for item in request.session.items if item.getparent(pytest.Module) is module):
+        request.getfixturevalue('notion_cleanups')
+
+
 def delete_all_taskslists():
     """Delete all taskslists except of the default one."""
     gtasks = GTasksClient(read_only=False)
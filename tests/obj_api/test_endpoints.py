@@ -0,0 +1,79 @@
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from ultimate_notion.obj_api import blocks as obj_blocks
+from ultimate_notion.obj_api import objects as objs
+from ultimate_notion.obj_api import schema as obj_schema
+from ultimate_notion.obj_api.endpoints import DatabasesEndpoint, NotionAPI
+from ultimate_notion.obj_api.enums import NumberFormat
+
+
+def test_build_db_request():
+    """Make sure that objects get serialized but already serialized items are passed as they are."""
+    parent_ref = objs.PageRef.build(uuid4())
+    number_dct = obj_schema.Number.build(NumberFormat.DOLLAR).serialize_for_api()
+    schema = {'Name': obj_schema.Title.build(), 'Cost': number_dct, 'Removed': None}
+
+    request = DatabasesEndpoint._build_request(parent_ref, schema)
+    assert request['parent'] == parent_ref.serialize_for_api()
+    assert request['properties'] == {
+        'Name': obj_schema.Title.build().serialize_for_api(),
+        'Cost': number_dct,
+        'Removed': None,
+    }
+    assert request['properties']['Cost'] is number_dct
+
+    serialized_request = DatabasesEndpoint._build_request(request['parent'], request['properties'])
+    assert serialized_request == request
+
+
+def test_endpoints_slots():
+    api = NotionAPI(MagicMock())
+    for endpoint in (api, api.blocks, api.blocks.children, api.databases, api.pages, api.pages.properties, api.users):
+        assert not hasattr(endpoint, '__dict__')
+
+
+def make_block_obj(type_name: str, type_data: dict[str, Any]) -> obj_blocks.Block:
+    """Return a block as retrieved from the Notion API."""
+    user = {'object': 'user', 'id': str(uuid4())}
+    return obj_blocks.Block.model_validate(
+        {
+            'object': 'block',
+            'id': str(uuid4()),
+            'parent': {'type': 'page_id', 'page_id': str(uuid4())},
+            'created_time': '2024-08-01T12:00:00.000Z',
+            'created_by': user,
+            'last_edited_time': '2024-08-01T12:00:00.000Z',
+            'last_edited_by': user,
+            'has_children': False,
+            'archived': False,
+            'in_trash': False,
+            'type': type_name,
+            type_name: type_data,
+        }
+    )
+
+
+def test_update_block_request():
+    """Make sure that only the type-specific data and the trash state of a block are sent."""
+    api = NotionAPI(MagicMock())
+    block = make_block_obj('paragraph', {'rich_text': [], 'color': 'red'})
+    api.client.blocks.update.return_value = block.serialize_for_api()
+
+    api.blocks.update(block)
+    (block_id,), request = api.client.blocks.update.call_args
+    assert block_id == block.id.hex
+    assert request == {'paragraph': {'rich_text': [], 'color': 'red'}, 'archived': False, 'in_trash': False}
+
+
+def test_update_synced_block_request():
+    """Make sure that the serialization of the synced block, which keeps `synced_from`, is used."""
+    api = NotionAPI(MagicMock())
+    block = make_block_obj('synced_block', {'synced_from': None})
+    assert isinstance(block, obj_blocks.SyncedBlock)
+    api.client.blocks.update.return_value = block.serialize_for_api()
+
+    api.blocks.update(block)
+    _, request = api.client.blocks.update.call_args
+    assert request['synced_block'] == {'synced_from': None}
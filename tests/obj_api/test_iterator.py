@@ -0,0 +1,101 @@
+from collections.abc import Iterable
+from typing import Any
+from uuid import UUID
+
+import httpx
+import pytest
+from notion_client.errors import APIErrorCode, APIResponseError
+
+from ultimate_notion.obj_api import iterator
+from ultimate_notion.obj_api.core import NotionObject
+from ultimate_notion.obj_api.iterator import EndpointIterator
+
+
+def make_endpoint(n_pages: int, calls: list[str | None]):
+    """Return a fake endpoint delivering `n_pages` pages of user objects."""
+
+    def endpoint(start_cursor: str | None = None, **kwargs: Any) -> dict[str, Any]:
+        calls.append(start_cursor)
+        page_num = 0 if start_cursor is None else int(start_cursor)
+        has_more = page_num + 1 < n_pages
+        return {
+            'object': 'list',
+            'type': 'user',
+            'results': [{'object': 'user', 'id': f'00000000-0000-0000-0000-{page_num:012d}', 'type': 'person'}],
+            'has_more': has_more,
+            'next_cursor': str(page_num + 1) if has_more else None,
+        }
+
+    return endpoint
+
+
+def page_nums(objs: Iterable[NotionObject]) -> list[int]:
+    """Return the page numbers encoded in the ids of the objects delivered by the fake endpoint."""
+    ids = [obj.id for obj in objs]
+    assert all(isinstance(obj_id, UUID) for obj_id in ids)
+    return [obj_id.int for obj_id in ids if isinstance(obj_id, UUID)]
+
+
+@pytest.mark.parametrize('prefetch', [False, True])
+def test_endpoint_iterator(*, prefetch: bool):
+    calls: list[str | None] = []
+    endpoint_iter = EndpointIterator(make_endpoint(3, calls), prefetch=prefetch)
+
+    results = list(endpoint_iter())
+    assert page_nums(results) == [0, 1, 2]
+    assert calls == [None, '1', '2']
+    assert endpoint_iter.page_num == 3
+    assert endpoint_iter.total_items == 3
+    assert endpoint_iter.has_more is False
+
+
+@pytest.mark.parametrize('prefetch', [False, True])
+def test_endpoint_iterator_max_results(*, prefetch: bool):
+    calls: list[str | None] = []
+    endpoint_iter = EndpointIterator(make_endpoint(4, calls), prefetch=prefetch, max_results=2)
+
+    results = endpoint_iter()
+    assert page_nums([next(results)]) == [0]
+    assert endpoint_iter.next_cursor is None  # only updated after all results of a page are consumed
+    assert page_nums(results) == [1]
+    assert calls == [None, '1']  # no page beyond the limit is requested
+    assert endpoint_iter.page_num == 2
+    assert endpoint_iter.total_items == 2
+
+
+def test_endpoint_iterator_rate_limit(monkeypatch: pytest.MonkeyPatch):
+    delays: list[float] = []
+    monkeypatch.setattr(iterator.time, 'sleep', delays.append)
+
+    calls: list[str | None] = []
+    fetch_page = make_endpoint(1, calls)
+    response = httpx.Response(429, headers={'Retry-After': '3'})
+    errors = [APIResponseError(response, 'rate limited', APIErrorCode.RateLimited)]
+
+    def endpoint(**kwargs: Any) -> dict[str, Any]:
+        if errors:
+            raise errors.pop()
+        return fetch_page(**kwargs)
+
+    assert len(list(EndpointIterator(endpoint)())) == 1
+    assert delays == [3.0]
+
+    def failing_endpoint(**kwargs: Any) -> dict[str, Any]:
+        raise APIResponseError(httpx.Response(400), 'invalid', APIErrorCode.ValidationError)
+
+    with pytest.raises(APIResponseError):
+        list(EndpointIterator(failing_endpoint)())
+
+
+def test_endpoint_iterator_page():
+    calls: list[str | None] = []
+    endpoint_iter = EndpointIterator(make_endpoint(2, calls))
+
+    results, next_cursor, has_more = endpoint_iter.page()
+    assert page_nums(results) == [0]
+    assert (next_cursor, has_more) == ('1', True)
+
+    results, next_cursor, has_more = endpoint_iter.page(start_cursor=next_cursor)
+    assert page_nums(results) == [1]
+    assert (next_cursor, has_more) == (None, False)
+    assert calls == [None, '1']
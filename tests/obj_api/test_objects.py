@@ -1,4 +1,5 @@
 import datetime as dt
+from uuid import uuid4
 
 import pendulum as pnd
 import pytest
@@ -43,3 +44,23 @@ def test_date_range(tz_berlin):
 
     with pytest.raises(ValueError):
         objs.DateRange.build(dt.datetime(2024, 1, 1, 12, 0, 0, tzinfo=dt.timezone.utc))
+
+
+def test_object_reference():
+    obj_id = uuid4()
+    for ref in (obj_id, str(obj_id), f'https://notion.so/page-title-{obj_id.hex}'):
+        assert objs.ObjectReference.build(ref).id == obj_id
+        assert objs.get_uuid(ref) == obj_id
+
+    obj_ref = objs.ObjectReference.build(obj_id)
+    copied_ref = objs.ObjectReference.build(obj_ref)
+    assert copied_ref == obj_ref
+    assert copied_ref is not obj_ref
+
+    db_ref = objs.DatabaseRef.build(obj_id)
+    assert db_ref.database_id == obj_id
+    assert objs.PageRef.build(db_ref).page_id == obj_id
+    assert objs.ObjectReference.build(objs.User.model_construct(id=obj_id)).id == obj_id
+
+    with pytest.raises(ValueError):
+        objs.ObjectReference.build('no id')
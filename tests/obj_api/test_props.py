@@ -9,3 +9,12 @@ def test_number():
     obj = obj_props.Number.build(42.0)
     assert obj.number == 42.0
     assert isinstance(obj.number, float)
+
+
+def test_value():
+    assert obj_props.Number.build(42).value == 42
+    assert obj_props.Checkbox.build(True).value is True
+    assert obj_props.URL.build('https://notion.so').value == 'https://notion.so'
+    # subclasses with their own `value` implementation are left untouched
+    assert obj_props.StringFormula.model_construct(string='hello').value == 'hello'
+    assert obj_props.BooleanFormula.model_construct(boolean=False).value is False
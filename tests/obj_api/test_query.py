@@ -0,0 +1,87 @@
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any
+
+import pytest
+
+from ultimate_notion.obj_api import iterator
+from ultimate_notion.obj_api.iterator import MAX_PAGE_SIZE
+from ultimate_notion.obj_api.query import DBQueryBuilder, DBSort, SortDirection
+
+
+def test_db_query_params():
+    """Make sure that the selected properties, filters and sorts are passed to the endpoint."""
+    requests: list[dict[str, Any]] = []
+
+    def endpoint(**kwargs: Any) -> dict[str, Any]:
+        requests.append(kwargs)
+        return {'object': 'list', 'type': 'page', 'results': [], 'has_more': False, 'next_cursor': None}
+
+    query = DBQueryBuilder(endpoint, db_id='db_id').select('title', 'abc')
+    query = query.sort(DBSort(property='Name', direction=SortDirection.ASCENDING))
+    assert list(query.execute()) == []
+
+    (request,) = requests
+    assert request['database_id'] == 'db_id'
+    assert request['filter_properties'] == ['title', 'abc']
+    assert request['sorts'] == [{'property': 'Name', 'direction': 'ascending'}]
+
+    query = DBQueryBuilder(endpoint, db_id='db_id', filter_properties=['title'])
+    assert query.params['filter_properties'] == ['title']
+    assert 'filter_properties' not in DBQueryBuilder(endpoint, db_id='db_id').params
+
+
+def test_db_query_limit():
+    """Make sure that no more results than requested are retrieved."""
+    requests: list[dict[str, Any]] = []
+
+    def endpoint(**kwargs: Any) -> dict[str, Any]:
+        requests.append(kwargs)
+        page_num = len(requests)
+        user = {'object': 'user', 'id': f'00000000-0000-0000-0000-{page_num:012d}', 'type': 'person'}
+        return {'object': 'list', 'type': 'user', 'results': [user] * 2, 'has_more': True, 'next_cursor': 'next'}
+
+    results = list(DBQueryBuilder(endpoint, db_id='db_id', prefetch=True).limit(3).execute())
+    assert len(results) == 3
+    assert len(requests) == 2
+    assert requests[0]['page_size'] == 3
+
+    requests.clear()
+    assert len(list(DBQueryBuilder(endpoint, db_id='db_id').limit(1000).execute())) == 1000
+    assert requests[0]['page_size'] == MAX_PAGE_SIZE
+
+
+class SyncExecutor:
+    """Executor running the prefetch requests right away, so that every submitted request is recorded."""
+
+    def __init__(self, max_workers: int):
+        pass
+
+    @staticmethod
+    def submit(fn: Callable[..., Any], /, **kwargs: Any) -> Future:
+        future: Future = Future()
+        future.set_result(fn(**kwargs))
+        return future
+
+    @staticmethod
+    def shutdown(*, wait: bool, cancel_futures: bool):
+        pass
+
+
+def test_db_query_first(monkeypatch: pytest.MonkeyPatch):
+    """Make sure that no further page is requested, not even prefetched, when only the first result is needed."""
+    monkeypatch.setattr(iterator, 'ThreadPoolExecutor', SyncExecutor)
+    requests: list[dict[str, Any]] = []
+
+    def endpoint(**kwargs: Any) -> dict[str, Any]:
+        requests.append(kwargs)
+        user = {'object': 'user', 'id': f'00000000-0000-0000-0000-{len(requests):012d}', 'type': 'person'}
+        return {'object': 'list', 'type': 'user', 'results': [user] * 2, 'has_more': True, 'next_cursor': 'next'}
+
+    query = DBQueryBuilder(endpoint, db_id='db_id', prefetch=True)
+    assert query.first() is not None
+    assert len(requests) == 1
+
+    requests.clear()
+    assert len(list(query.limit(3).execute())) == 3  # `first` didn't change the query
+    assert len(requests) == 2
@@ -7,9 +7,13 @@ More details here: https://github.com/python/mypy/issues/3004
 
 from __future__ import annotations
 
+from uuid import uuid4
+
 import pytest
 
 from ultimate_notion import Database, Page, RichText, Session, schema
+from ultimate_notion.obj_api import blocks as obj_blocks
+from ultimate_notion.obj_api import schema as obj_schema
 
 from .conftest import CONTACTS_DB
 
@@ -163,3 +167,37 @@ def test_parent_subdbs(notion: Session, root_page: Page):
 def test_new_task_db(new_task_db: Database):
     # ToDo: Implement a proper test
     pass
+
+
+def test_reflected_schema_per_wrapper():
+    def make_db_obj(db_id):
+        props = {'Name': obj_schema.Title(id='title', name='Name'), 'Cost': obj_schema.Number(id='abc', name='Cost')}
+        return obj_blocks.Database.model_construct(id=db_id, title=[], properties=props)
+
+    db_id = uuid4()
+    db1 = Database.wrap_obj_ref(make_db_obj(db_id))
+    db2 = Database.wrap_obj_ref(make_db_obj(db_id))
+    assert db1.schema is not db2.schema
+    assert db1.schema.get_db() is db1
+    assert db2.schema.get_db() is db2
+    assert db1.schema.get_prop('Cost').type.obj_ref is db1.obj_ref.properties['Cost']
+    assert db2.schema.get_prop('Cost').type.obj_ref is db2.obj_ref.properties['Cost']
+
+    db3 = Database.wrap_obj_ref(make_db_obj(uuid4()))
+    assert db3.schema is not db2.schema
+    assert db3.schema.to_dict() == db2.schema.to_dict()
+
+
+def test_db_str():
+    db_obj = obj_blocks.Database.model_construct(id=uuid4(), title=[], properties={})
+    assert str(Database.wrap_obj_ref(db_obj)) == 'Untitled'
+
+    db_obj = obj_blocks.Database.model_construct(id=uuid4(), title=RichText('My DB').obj_ref, properties={})
+    db = Database.wrap_obj_ref(db_obj)
+    assert str(db) == 'My DB'
+    assert db.title == 'My DB'
+    assert db.title is db.title
+
+    title = (RichText('My ') + RichText('DB')).obj_ref
+    db_obj = obj_blocks.Database.model_construct(id=uuid4(), title=title, properties={})
+    assert str(Database.wrap_obj_ref(db_obj)) == 'My DB'
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 from datetime import datetime
+from uuid import uuid4
 
 from hypothesis import given
 from hypothesis import strategies as st
 
-from ultimate_notion.props import Date
+from ultimate_notion.file import FileInfo
+from ultimate_notion.obj_api import objects as objs
+from ultimate_notion.obj_api import props as obj_props
+from ultimate_notion.option import Option
+from ultimate_notion.props import Checkbox, Date, Files, MultiSelect, Number, People, Relations
+from ultimate_notion.user import User
 
 
 @given(
@@ -22,3 +28,62 @@ def test_date_with_datetime(d1, d2):
     # ToDo: Implement actual test
     Date(d1)
     Date(d1, d2)
+
+
+def test_contains():
+    tags = MultiSelect(['Tag1', Option('Tag2')])
+    assert 'Tag1' in tags
+    assert Option('Tag2') in tags
+    assert 'Tag3' not in tags
+
+    user = User.wrap_obj_ref(objs.Person.model_construct(id=uuid4(), object='user', type='person'))
+    people = People([user])
+    assert user in people
+    assert user.id in people
+    assert str(user.id) in people
+    assert uuid4() not in people
+    assert 'no id' not in people
+
+    file_info = FileInfo(url='https://www.example.com/file.png', name='File')
+    files = Files([file_info])
+    assert file_info in files
+    assert 'https://www.example.com/file.png' in files
+    assert 'https://www.example.com/other.png' not in files
+
+    page_id = uuid4()
+    relations = Relations.wrap_obj_ref(obj_props.Relation.build([page_id]))
+    assert page_id in relations
+    assert str(page_id) in relations
+    assert page_id.hex in relations
+    assert uuid4() not in relations
+    assert 'no id' not in relations
+
+
+def test_multi_select_unique():
+    tags = MultiSelect(['Tag1', Option('Tag2'), Option('Tag1'), 'Tag2', 'Tag3'])
+    assert [option.name for option in tags.value] == ['Tag1', 'Tag2', 'Tag3']
+    assert str(tags) == 'Tag1, Tag2, Tag3'
+    assert str(MultiSelect([])) == ''
+
+
+def test_empty_str():
+    assert str(People([])) == ''
+    assert str(Relations([])) == ''
+    assert str(Files([])) == ''
+
+
+def test_eq():
+    assert Number(1) == Number(1)
+    assert Number(1) != Number(2)
+    assert Checkbox(True) == Checkbox(True)
+    assert Checkbox(True) != Checkbox(False)
+    assert Number(1) != Checkbox(True)
+    tags = MultiSelect(['Tag1', 'Tag2'])
+    assert tags == tags  # noqa: PLR0124
+    assert tags == MultiSelect(['Tag1', 'Tag2'])
+    assert tags != MultiSelect(['Tag1'])
+
+    page_id = uuid4()
+    relations = Relations.wrap_obj_ref(obj_props.Relation.build([page_id]))
+    assert relations == Relations.wrap_obj_ref(obj_props.Relation.build([page_id]))
+    assert relations != Relations.wrap_obj_ref(obj_props.Relation.build([uuid4()]))
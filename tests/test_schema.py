@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 
 import pytest
 
-from ultimate_notion import Color, Session, props, schema
+from ultimate_notion import Color, NumberFormat, Session, props, schema
 from ultimate_notion.database import Database
 from ultimate_notion.file import FileInfo
 from ultimate_notion.option import Option
@@ -81,7 +81,7 @@ def test_all_createable_props_schema(notion: Session, root_page: Page):
 
     kwargs: dict[str, PropertyValue] = {
         'checkbox': props.Checkbox(True),
-        'date': props.Date(datetime.now(tz=timezone.utc).date()),
+        'date': props.Date(date(2024, 8, 2)),  # fixed date as recorded in the cassette
         'email': props.Email('email@provider.com'),
         'files': props.Files([FileInfo(name='My File', url='https://...')]),
         'multi_select': props.MultiSelect(options[0]),
@@ -212,3 +212,17 @@ def test_schema_from_dict():
     with pytest.raises(SchemaError):
         dict_style_schema = {'Name1': schema.Title(), 'Name2': schema.Title()}
         DictStyleSchema = PageSchema.from_dict(dict_style_schema, db_title='Dict Style')  # noqa: N806
+
+
+def test_attr_prop_map():
+    class Schema(PageSchema, db_title='Schema'):
+        name = Property('Name', schema.Title())
+        tags = Property('My Tags', schema.MultiSelect([]))
+
+    class SubSchema(Schema, db_title='Sub Schema'):
+        cost = Property('Cost', schema.Number(NumberFormat.DOLLAR))
+
+    attr_prop_map = Schema._get_attr_prop_map()
+    assert attr_prop_map == {'name': Schema.name, 'tags': Schema.tags}
+    assert Schema._get_attr_prop_map() is attr_prop_map
+    assert SubSchema._get_attr_prop_map() == {'cost': SubSchema.cost}
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from uuid import uuid4
+
 import pytest
 
+import ultimate_notion as uno
 from ultimate_notion import Page, Session
+from ultimate_notion.obj_api import blocks as obj_blocks
+from ultimate_notion.obj_api.endpoints import BlocksEndpoint
+from ultimate_notion.obj_api.objects import get_uuid
 
 from .conftest import CONTACTS_DB
 
@@ -46,3 +52,25 @@ def test_all_users(notion: Session):
     users = notion.all_users()
     me = notion.whoami()
     assert me in users
+
+
+def test_get_block_cache(notion: Session, monkeypatch: pytest.MonkeyPatch):
+    texts = iter(['Original text', 'Text changed in Notion'])
+
+    def retrieve(self: BlocksEndpoint, block: obj_blocks.Block | str) -> obj_blocks.Block:
+        block_obj = uno.Paragraph(next(texts)).obj_ref
+        block_obj.id = get_uuid(block)
+        return block_obj
+
+    monkeypatch.setattr(BlocksEndpoint, 'retrieve', retrieve)
+    block_id = uuid4()
+
+    block = notion.get_block(block_id)
+    assert isinstance(block, uno.Paragraph)
+    assert block.rich_text == 'Original text'
+
+    changed_block = notion.get_block(block_id)
+    assert isinstance(changed_block, uno.Paragraph)
+    assert changed_block.rich_text == 'Text changed in Notion'
+
+    assert notion.get_block(block_id, use_cache=True) is changed_block
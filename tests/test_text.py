@@ -6,7 +6,7 @@ import pytest
 import ultimate_notion as uno
 from ultimate_notion import Database, Page, Session, User
 from ultimate_notion.blocks import TextBlock
-from ultimate_notion.text import camel_case, decapitalize, is_url, snake_case
+from ultimate_notion.text import MAX_TEXT_OBJECT_SIZE, camel_case, decapitalize, is_url, snake_case
 
 
 def test_decapitalize():
@@ -49,6 +49,37 @@ def test_is_url():
     assert not is_url('www.example.com')
 
 
+def test_rich_text_obj_ref():
+    text = uno.RichText('Notion') + uno.Math('E=mc^2')
+    obj_refs = text.obj_ref
+    assert [obj_ref.plain_text for obj_ref in obj_refs] == ['Notion', 'E=mc^2']
+    assert str(uno.RichText.wrap_obj_ref(obj_refs)) == 'NotionE=mc^2'
+    obj_refs.clear()  # the returned list is a copy
+    assert len(text.obj_ref) == 2
+
+
+def test_rich_text_chunks():
+    assert uno.RichText('').obj_ref == []
+    assert len(uno.RichText('a' * MAX_TEXT_OBJECT_SIZE).obj_ref) == 1
+    assert len(uno.RichText('a' * (MAX_TEXT_OBJECT_SIZE + 1)).obj_ref) == 2
+
+
+def test_join():
+    assert uno.join([]) == ''
+    assert uno.join(['Notion', uno.Text('is'), uno.RichText('cool')]) == 'Notion is cool'
+    assert uno.join(['Notion', 'is', 'cool'], delim=uno.Text(', ')) == 'Notion, is, cool'
+
+
+def test_rich_text_eq_hash():
+    text = uno.RichText('Notion is cool')
+    assert text == 'Notion is cool'
+    assert text == uno.RichText('Notion is cool')
+    assert text != 'Notion is not cool'
+    assert text != 42
+    assert hash(text) == hash('Notion is cool')
+    assert {text: 1}['Notion is cool'] == 1
+
+
 @pytest.mark.vcr()
 def test_rich_text_md(md_text_page: Page):
     """These markdowns were tested with https://stackedit.io/app#"""